@@ -0,0 +1,30 @@
+"""Composite index for latest payment request per participant
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (bill_participant_id, created_at) serves both participant filters and
+    # newest-first lookups, superseding the single-column participant index
+    op.create_index(
+        'idx_payment_requests_participant_created',
+        'payment_requests',
+        ['bill_participant_id', 'created_at']
+    )
+    op.drop_index('idx_payment_requests_participant_id', 'payment_requests')
+
+
+def downgrade() -> None:
+    op.create_index('idx_payment_requests_participant_id', 'payment_requests', ['bill_participant_id'])
+    op.drop_index('idx_payment_requests_participant_created', 'payment_requests')
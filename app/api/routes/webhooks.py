@@ -19,7 +19,7 @@ from app.core.config import settings
 from app.database.repositories import SQLUserRepository
 from app.models.schemas import Message, Response
 from app.models.enums import MessageType
-from app.utils.logging import get_logger
+from app.utils.logging import get_logger, bind_request_context
 
 logger = get_logger(__name__)
 
@@ -227,6 +227,11 @@ class WebhookHandler:
                     phone_number=webhook_payload.from_number
                 )
 
+            # Bind once so downstream error logging picks up the user
+            bind_request_context(
+                user_id=str(user.id), message_id=webhook_payload.message_id
+            )
+
             # Convert webhook payload to internal message format (stable user + context)
             message = Message(
                 id=webhook_payload.message_id,
@@ -149,14 +149,11 @@ def query(query: str):
             if result.returns_rows:
                 rows = result.fetchall()
                 if rows:
-                    # Print column headers
-                    columns = result.keys()
-                    click.echo(" | ".join(columns))
-                    click.echo("-" * (len(" | ".join(columns))))
-                    
-                    # Print rows
-                    for row in rows:
-                        click.echo(" | ".join(str(value) for value in row))
+                    # Build header and rows, then write the table in one call
+                    header = " | ".join(result.keys())
+                    lines = [header, "-" * len(header)]
+                    lines.extend(" | ".join(str(value) for value in row) for row in rows)
+                    click.echo("\n".join(lines))
                 else:
                     click.echo("No rows returned")
             else:
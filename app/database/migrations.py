@@ -10,6 +10,11 @@ from app.models.database import User, Contact, Bill, BillParticipant, PaymentReq
 
 logger = logging.getLogger(__name__)
 
+REQUIRED_TABLES = (
+    'users', 'contacts', 'bills', 'bill_participants',
+    'payment_requests', 'conversation_states'
+)
+
 
 class MigrationManager:
     """Manages database migrations and schema updates"""
@@ -102,7 +107,9 @@ class MigrationManager:
             "CREATE INDEX IF NOT EXISTS idx_bill_participants_bill_id ON bill_participants (bill_id);",
             "CREATE INDEX IF NOT EXISTS idx_bill_participants_contact_id ON bill_participants (contact_id);",
             "CREATE INDEX IF NOT EXISTS idx_bill_participants_status ON bill_participants (payment_status);",
-            "CREATE INDEX IF NOT EXISTS idx_payment_requests_participant_id ON payment_requests (bill_participant_id);",
+            "CREATE INDEX IF NOT EXISTS idx_payment_requests_participant_created ON payment_requests (bill_participant_id, created_at);",
+            # Superseded by the composite participant/created_at index above
+            "DROP INDEX IF EXISTS idx_payment_requests_participant_id;",
             "CREATE INDEX IF NOT EXISTS idx_payment_requests_created_at ON payment_requests (created_at);",
             "CREATE INDEX IF NOT EXISTS idx_conv_states_user_id ON conversation_states (user_id);",
             "CREATE INDEX IF NOT EXISTS idx_conv_states_session_id ON conversation_states (session_id);",
@@ -128,20 +135,16 @@ class MigrationManager:
                 # Check if all required tables exist
                 inspector = inspect(self.engine)
                 existing_tables = inspector.get_table_names()
+                existing_table_set = set(existing_tables)
                 
-                required_tables = [
-                    'users', 'contacts', 'bills', 'bill_participants', 
-                    'payment_requests', 'conversation_states'
-                ]
-                
-                missing_tables = [table for table in required_tables if table not in existing_tables]
+                missing_tables = [table for table in REQUIRED_TABLES if table not in existing_table_set]
                 
                 return {
                     'status': 'healthy' if not missing_tables else 'missing_tables',
                     'connection': 'ok' if health_check else 'failed',
                     'existing_tables': existing_tables,
                     'missing_tables': missing_tables,
-                    'required_tables': required_tables
+                    'required_tables': list(REQUIRED_TABLES)
                 }
                 
         except SQLAlchemyError as e:
@@ -156,27 +159,22 @@ class MigrationManager:
         """Validate database schema after creation"""
         try:
             inspector = inspect(self.engine)
-            existing_tables = inspector.get_table_names()
-            
-            required_tables = [
-                'users', 'contacts', 'bills', 'bill_participants', 
-                'payment_requests', 'conversation_states'
-            ]
+            existing_tables = set(inspector.get_table_names())
             
-            missing_tables = [table for table in required_tables if table not in existing_tables]
+            missing_tables = [table for table in REQUIRED_TABLES if table not in existing_tables]
             
             # Check for required columns in each table
             validation_errors = []
             
             if 'users' in existing_tables:
-                user_columns = [col['name'] for col in inspector.get_columns('users')]
+                user_columns = {col['name'] for col in inspector.get_columns('users')}
                 required_user_cols = ['id', 'phone_number', 'name', 'created_at', 'updated_at']
                 missing_user_cols = [col for col in required_user_cols if col not in user_columns]
                 if missing_user_cols:
                     validation_errors.append(f"Users table missing columns: {missing_user_cols}")
             
             if 'bills' in existing_tables:
-                bill_columns = [col['name'] for col in inspector.get_columns('bills')]
+                bill_columns = {col['name'] for col in inspector.get_columns('bills')}
                 required_bill_cols = ['id', 'user_id', 'total_amount', 'status', 'created_at']
                 missing_bill_cols = [col for col in required_bill_cols if col not in bill_columns]
                 if missing_bill_cols:
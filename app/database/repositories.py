@@ -41,7 +41,6 @@ class SQLUserRepository(UserRepository):
             user = User(phone_number=phone_number, name=name)
             self.db.add(user)
             self.db.commit()
-            self.db.refresh(user)
             logger.info(f"Created user with ID: {user.id}")
             return user
         except SQLAlchemyError as e:
@@ -95,7 +94,6 @@ class SQLUserRepository(UserRepository):
         """Create a new user entity"""
         self.db.add(entity)
         self.db.commit()
-        self.db.refresh(entity)
         return entity
 
     async def get_by_id(self, entity_id: UUID) -> Optional[User]:
@@ -1008,7 +1006,17 @@ class DatabaseRepository:
     ) -> Dict[str, Any]:
         """Get payment request statistics"""
         try:
-            query = self.db.query(PaymentRequest)
+            whatsapp_sent = PaymentRequest.whatsapp_sent.is_(True)
+            sms_sent = PaymentRequest.sms_sent.is_(True)
+
+            # Aggregate every counter in a single pass on the database side
+            query = self.db.query(
+                func.count(PaymentRequest.id),
+                func.count(PaymentRequest.id).filter(or_(whatsapp_sent, sms_sent)),
+                func.count(PaymentRequest.id).filter(whatsapp_sent),
+                func.count(PaymentRequest.id).filter(sms_sent),
+                func.count(PaymentRequest.id).filter(PaymentRequest.status == "confirmed"),
+            ).select_from(PaymentRequest)
 
             if bill_id:
                 query = query.join(BillParticipant).filter(
@@ -1018,16 +1026,14 @@ class DatabaseRepository:
             if since_date:
                 query = query.filter(PaymentRequest.created_at >= since_date)
 
-            requests = query.all()
-
-            total_requests = len(requests)
-            successful_deliveries = len(
-                [r for r in requests if r.whatsapp_sent or r.sms_sent]
-            )
+            (
+                total_requests,
+                successful_deliveries,
+                whatsapp_deliveries,
+                sms_deliveries,
+                confirmed_payments,
+            ) = query.one()
             failed_deliveries = total_requests - successful_deliveries
-            whatsapp_deliveries = len([r for r in requests if r.whatsapp_sent])
-            sms_deliveries = len([r for r in requests if r.sms_sent])
-            confirmed_payments = len([r for r in requests if r.status == "confirmed"])
 
             success_rate = (
                 successful_deliveries / total_requests if total_requests > 0 else 0.0
@@ -96,6 +96,9 @@ async def lifespan(app: FastAPI):
         )
     except Exception as e:
         logger.error(f"Error during shutdown logging: {e}")
+    finally:
+        # Flush queued error events before the loop goes away
+        await error_monitor.shutdown()
 
 
 async def initialize_services():
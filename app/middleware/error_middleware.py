@@ -5,6 +5,8 @@ Implements requirements 7.1, 7.2, 7.3, 7.4, 7.5
 import logging
 import traceback
 import asyncio
+import random
+import uuid
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 from fastapi import Request, Response, HTTPException
@@ -17,9 +19,13 @@ from pydantic import ValidationError
 
 from app.models.enums import ErrorType
 from app.core.config import settings
+from app.utils.logging import bind_request_context, reset_request_context
 
 logger = logging.getLogger(__name__)
 
+# Dedicated RNG for retry jitter, independent of the global random state
+_retry_random = random.Random()
+
 
 class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     """
@@ -30,6 +36,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: ASGIApp):
         super().__init__(app)
         self.error_handlers = self._setup_error_handlers()
+        self.error_type_map = self._setup_error_type_map()
         self.retry_config = {
             "max_retries": 3,
             "base_delay": 1.0,
@@ -54,6 +61,21 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             Exception: self._handle_generic_error
         }
     
+    def _setup_error_type_map(self) -> Dict[type, ErrorType]:
+        """Setup exception type to application error type mapping"""
+        return {
+            SQLAlchemyError: ErrorType.DATABASE,
+            DisconnectionError: ErrorType.DATABASE,
+            SQLTimeoutError: ErrorType.DATABASE,
+            TimeoutException: ErrorType.EXTERNAL_SERVICE,
+            ConnectError: ErrorType.EXTERNAL_SERVICE,
+            HTTPStatusError: ErrorType.EXTERNAL_SERVICE,
+            ValidationError: ErrorType.VALIDATION,
+            ValueError: ErrorType.BUSINESS_LOGIC,
+            KeyError: ErrorType.BUSINESS_LOGIC,
+            AttributeError: ErrorType.BUSINESS_LOGIC
+        }
+    
     async def dispatch(self, request: Request, call_next) -> Response:
         """
         Main middleware dispatch method
@@ -64,6 +86,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         
         # Add request ID to request state for logging
         request.state.request_id = request_id
+        context_token = bind_request_context(request_id=request_id)
         
         try:
             # Log incoming request
@@ -82,6 +105,9 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             # Handle error and return appropriate response
             duration = (datetime.now() - start_time).total_seconds()
             return await self._handle_error(e, request, request_id, duration)
+        
+        finally:
+            reset_request_context(context_token)
     
     async def _handle_error(self, error: Exception, request: Request, 
                           request_id: str, duration: float) -> JSONResponse:
@@ -113,13 +139,10 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     
     def _get_error_handler(self, error_type: type) -> Callable:
         """Get appropriate error handler for exception type"""
-        # Check for exact match first
-        if error_type in self.error_handlers:
-            return self.error_handlers[error_type]
-        
-        # Check for parent class matches
-        for exception_type, handler in self.error_handlers.items():
-            if issubclass(error_type, exception_type):
+        # Walk the MRO so the most specific registered handler wins
+        for cls in error_type.__mro__:
+            handler = self.error_handlers.get(cls)
+            if handler is not None:
                 return handler
         
         # Default to generic handler
@@ -127,16 +150,12 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     
     def _classify_error_type(self, error: Exception) -> ErrorType:
         """Classify exception into application error type"""
-        if isinstance(error, (SQLAlchemyError, DisconnectionError, SQLTimeoutError)):
-            return ErrorType.DATABASE
-        elif isinstance(error, (TimeoutException, ConnectError, HTTPStatusError)):
-            return ErrorType.EXTERNAL_SERVICE
-        elif isinstance(error, ValidationError):
-            return ErrorType.VALIDATION
-        elif isinstance(error, (ValueError, KeyError, AttributeError)):
-            return ErrorType.BUSINESS_LOGIC
-        else:
-            return ErrorType.INPUT_PROCESSING
+        for cls in type(error).__mro__:
+            error_type = self.error_type_map.get(cls)
+            if error_type is not None:
+                return error_type
+        
+        return ErrorType.INPUT_PROCESSING
     
     async def _handle_http_exception(self, error: HTTPException, request: Request, 
                                    request_id: str) -> JSONResponse:
@@ -448,18 +467,19 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                 "client_ip": request.client.host if request.client else "unknown"
             }
             
-            # Add stack trace for critical errors
+            # Attach stack trace for critical errors; the logging handler only
+            # formats it if the record is actually emitted
+            exc_info = None
             if not isinstance(error, (HTTPException, ValidationError)):
-                error_context["traceback"] = traceback.format_exc()
+                exc_info = error
             
-            logger.error(f"Request {request_id} failed: {error_context}")
+            logger.error(f"Request {request_id} failed: {error_context}", exc_info=exc_info)
             
         except Exception as log_error:
             logger.critical(f"Failed to log error for request {request_id}: {log_error}")
     
     def _generate_request_id(self) -> str:
         """Generate unique request ID for tracking"""
-        import uuid
         return str(uuid.uuid4())[:8]
 
 
@@ -483,6 +503,9 @@ class DatabaseRetryMixin:
             base_delay: Initial delay between retries in seconds
             max_delay: Maximum delay between retries in seconds
             exponential_base: Base for exponential backoff calculation
+        
+        Each wait is drawn uniformly from [0, backoff] (full jitter) so that
+        callers failing together do not retry in lockstep
         """
         last_exception = None
         
@@ -497,8 +520,8 @@ class DatabaseRetryMixin:
                     logger.error(f"Database operation failed after {max_retries + 1} attempts: {e}")
                     break
                 
-                # Calculate delay with exponential backoff
-                delay = min(base_delay * (exponential_base ** attempt), max_delay)
+                # Exponential backoff with full jitter to spread out concurrent retries
+                delay = _retry_random.uniform(0, min(base_delay * (exponential_base ** attempt), max_delay))
                 
                 logger.warning(f"Database operation failed (attempt {attempt + 1}/{max_retries + 1}), "
                              f"retrying in {delay:.1f}s: {e}")
@@ -534,6 +557,8 @@ class ExternalServiceRetryMixin:
             max_retries: Maximum number of retry attempts
             base_delay: Initial delay between retries in seconds
             timeout_multiplier: Multiplier for increasing timeout on retries
+        
+        Each wait is drawn uniformly from [0, backoff] (full jitter)
         """
         last_exception = None
         
@@ -548,7 +573,7 @@ class ExternalServiceRetryMixin:
                     logger.error(f"{service_name} operation failed after {max_retries + 1} attempts: {e}")
                     break
                 
-                delay = base_delay * (attempt + 1)
+                delay = _retry_random.uniform(0, base_delay * (attempt + 1))
                 
                 logger.warning(f"{service_name} operation failed (attempt {attempt + 1}/{max_retries + 1}), "
                              f"retrying in {delay:.1f}s: {e}")
@@ -567,7 +592,7 @@ class ExternalServiceRetryMixin:
                     logger.error(f"{service_name} server error after {max_retries + 1} attempts: {e}")
                     break
                 
-                delay = base_delay * (attempt + 1)
+                delay = _retry_random.uniform(0, base_delay * (attempt + 1))
                 
                 logger.warning(f"{service_name} server error (attempt {attempt + 1}/{max_retries + 1}), "
                              f"retrying in {delay:.1f}s: {e}")
@@ -11,6 +11,7 @@ from app.core.database import Base
 from app.database.encryption import encryption
 import uuid
 import logging
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,8 @@ class User(Base):
         Index('idx_users_phone', 'phone_number'),
         Index('idx_users_created_at', 'created_at'),
     )
+    # Fetch server-generated timestamps via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     _phone_number = Column('phone_number', String(255), unique=True, nullable=False)  # Encrypted
@@ -273,7 +276,8 @@ class PaymentRequest(Base):
     """Payment request model for tracking payment links and delivery"""
     __tablename__ = "payment_requests"
     __table_args__ = (
-        Index('idx_payment_requests_participant_id', 'bill_participant_id'),
+        # Covers participant lookups and "latest request for participant" without a sort
+        Index('idx_payment_requests_participant_created', 'bill_participant_id', 'created_at'),
         Index('idx_payment_requests_created_at', 'created_at'),
         Index('idx_payment_requests_status', 'status'),
     )
@@ -393,7 +397,6 @@ class ConversationState(Base):
         """Check if conversation state has expired"""
         if not self.expires_at:
             return False
-        from datetime import datetime
         return datetime.utcnow() > self.expires_at
     
     def __repr__(self):
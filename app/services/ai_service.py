@@ -4,6 +4,7 @@ Implements requirements 1.1, 1.2, 1.3, 1.4, 7.1
 """
 
 import asyncio
+import re
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
 from app.models.schemas import BillData, BillItem, ValidationResult, Message
@@ -319,8 +320,6 @@ class AIService(AIServiceInterface):
         """
         Basic fallback text extraction when AI services fail
         """
-        import re
-
         # Extract amounts using regex
         amount_pattern = r"₹?(\d+(?:\.\d{2})?)"
         amounts = [float(match) for match in re.findall(amount_pattern, text)]
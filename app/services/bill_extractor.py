@@ -17,6 +17,9 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Currency precision used for rounding and tolerance checks
+CURRENCY_PRECISION = Decimal('0.01')
+
 
 class BillExtractionError(Exception):
     """Exception raised when bill extraction fails"""
@@ -261,20 +264,20 @@ class BillExtractor(BillExtractorInterface):
         logger.info("Normalizing extracted bill data")
         
         # Normalize amount precision
-        normalized_amount = bill_data.total_amount.quantize(Decimal('0.01'))
+        normalized_amount = bill_data.total_amount.quantize(CURRENCY_PRECISION)
         
         # Clean description
         description = bill_data.description.strip() if bill_data.description else "Bill"
         
         # Normalize items
-        normalized_items = []
-        for item in bill_data.items:
-            normalized_item = BillItem(
+        normalized_items = [
+            BillItem(
                 name=item.name.strip(),
-                amount=item.amount.quantize(Decimal('0.01')),
+                amount=item.amount.quantize(CURRENCY_PRECISION),
                 quantity=max(1, item.quantity)
             )
-            normalized_items.append(normalized_item)
+            for item in bill_data.items
+        ]
         
         # Set current time if no date provided
         bill_date = bill_data.date or datetime.now()
@@ -304,7 +307,7 @@ class BillExtractor(BillExtractorInterface):
         # Items validation
         if bill_data.items:
             items_total = sum(item.amount * item.quantity for item in bill_data.items)
-            if abs(items_total - bill_data.total_amount) > Decimal('0.01'):
+            if abs(items_total - bill_data.total_amount) > CURRENCY_PRECISION:
                 warnings.append(f"Items total (₹{items_total}) doesn't match bill total (₹{bill_data.total_amount})")
         
         # Description validation
@@ -17,6 +17,7 @@ from app.models.schemas import (
 from app.models.enums import BillStatus, PaymentStatus
 from app.services.payment_request_service import PaymentRequestService
 from app.services.communication_service import CommunicationService
+from app.services.upi_service import UPIService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -271,6 +272,9 @@ class BillQueryService(BillQueryServiceInterface):
                 "details": []
             }
             
+            # Built on first use and shared by every participant in this batch
+            upi_service = None
+            
             for participant in participants_to_remind:
                 try:
                     # Get or create payment request for this participant
@@ -281,10 +285,10 @@ class BillQueryService(BillQueryServiceInterface):
                     
                     if not payment_request:
                         # Create new payment request if none exists
-                        from app.services.upi_service import UPIService
-                        upi_service = UPIService()
+                        if upi_service is None:
+                            upi_service = UPIService()
                         
-                        upi_link = await upi_service.generate_upi_link(
+                        upi_link = upi_service.generate_upi_link(
                             recipient_name=participant.contact.name,
                             amount=participant.amount_owed,
                             description=f"Payment for {bill.description or 'bill'}"
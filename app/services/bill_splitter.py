@@ -3,6 +3,8 @@ Bill splitting calculation engine
 Implements requirements 2.1, 2.2, 2.3, 2.4, 2.5
 """
 import logging
+import re
+from collections import Counter
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal, ROUND_HALF_UP
 from app.models.schemas import BillData, Participant, ValidationResult
@@ -297,8 +299,6 @@ class BillSplitter:
             custom_amounts = {}
             
             # Simple parsing for amounts like "John ₹50, Sarah ₹100"
-            import re
-            
             # Pattern to match name and amount combinations
             # Supports formats: "John ₹50", "John 50", "John: ₹50", "John - 50"
             pattern = r'([A-Za-z\s]+)[\s\-:]*[₹]?(\d+(?:\.\d{2})?)'
@@ -354,6 +354,7 @@ class BillSplitter:
                 return {}
             
             amounts = [p.amount_owed for p in participants]
+            status_counts = Counter(p.payment_status for p in participants)
             
             return {
                 "total_participants": len(participants),
@@ -361,8 +362,8 @@ class BillSplitter:
                 "average_amount": sum(amounts) / len(amounts),
                 "min_amount": min(amounts),
                 "max_amount": max(amounts),
-                "pending_count": len([p for p in participants if p.payment_status == PaymentStatus.PENDING]),
-                "confirmed_count": len([p for p in participants if p.payment_status == PaymentStatus.CONFIRMED])
+                "pending_count": status_counts[PaymentStatus.PENDING],
+                "confirmed_count": status_counts[PaymentStatus.CONFIRMED]
             }
             
         except Exception as e:
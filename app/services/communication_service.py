@@ -101,6 +101,7 @@ class CommunicationService(CommunicationServiceInterface):
         """
         try:
             result = await self.client.send_message_with_fallback(phone_number, message)
+            logged_at = datetime.now()
             
             # Log the complete delivery attempt with all methods tried
             for attempt in result.get("delivery_attempts", []):
@@ -109,7 +110,8 @@ class CommunicationService(CommunicationServiceInterface):
                     method=attempt.get("delivery_method"),
                     success=attempt.get("success", False),
                     message_id=attempt.get("message_id"),
-                    error=attempt.get("error")
+                    error=attempt.get("error"),
+                    timestamp=logged_at
                 )
             
             return {
@@ -160,6 +162,9 @@ class CommunicationService(CommunicationServiceInterface):
             
             results = await self.client.send_bulk_messages(bulk_messages)
             
+            # One clock read for the whole batch rather than one per attempt
+            logged_at = datetime.now()
+            
             # Process and log results
             processed_results = []
             for result in results:
@@ -172,7 +177,8 @@ class CommunicationService(CommunicationServiceInterface):
                         method=attempt.get("delivery_method"),
                         success=attempt.get("success", False),
                         message_id=attempt.get("message_id"),
-                        error=attempt.get("error")
+                        error=attempt.get("error"),
+                        timestamp=logged_at
                     )
                 
                 processed_results.append({
@@ -225,7 +231,8 @@ class CommunicationService(CommunicationServiceInterface):
         method: Optional[DeliveryMethod],
         success: bool,
         message_id: Optional[str],
-        error: Optional[str]
+        error: Optional[str],
+        timestamp: Optional[datetime] = None
     ):
         """Log delivery attempt for tracking and analytics"""
         log_entry = {
@@ -234,7 +241,7 @@ class CommunicationService(CommunicationServiceInterface):
             "success": success,
             "message_id": message_id,
             "error": error,
-            "timestamp": datetime.now()
+            "timestamp": timestamp or datetime.now()
         }
         
         self.delivery_log.append(log_entry)
@@ -4,8 +4,12 @@ Implements requirements 7.1, 7.2, 7.3 for comprehensive error handling
 """
 import logging
 import asyncio
-from typing import Dict, Any, Optional, Callable
+import re
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from datetime import datetime
+from sqlalchemy.exc import SQLAlchemyError
+from httpx import TimeoutException, ConnectError, HTTPStatusError
+from pydantic import ValidationError
 from app.models.enums import ConversationStep, MessageType, ErrorType
 from app.models.schemas import Message, Response, ConversationState, ErrorResponse
 from app.services.error_monitoring import error_monitor, ErrorSeverity
@@ -21,10 +25,40 @@ class ConversationErrorHandler:
     Provides graceful degradation and retry logic
     """
     
+    RECOVERY_SUGGESTIONS: Dict[ErrorType, Dict[str, Any]] = {
+        ErrorType.INPUT_PROCESSING: {
+            "retry": True,
+            "alternative_input": True,
+            "manual_entry": True
+        },
+        ErrorType.EXTERNAL_SERVICE: {
+            "retry": True,
+            "wait_time": "1-2 minutes",
+            "fallback_mode": True
+        },
+        ErrorType.BUSINESS_LOGIC: {
+            "check_input": True,
+            "help_available": True,
+            "reset_option": True
+        },
+        ErrorType.DATABASE: {
+            "retry": True,
+            "temporary": True,
+            "wait_time": "30 seconds"
+        },
+        ErrorType.VALIDATION: {
+            "check_format": True,
+            "examples_available": True,
+            "help_available": True
+        }
+    }
+    
     def __init__(self):
         self.max_retries = 3
         self.retry_delays = [1, 2, 4]  # Exponential backoff in seconds
         self.error_recovery_strategies = self._setup_recovery_strategies()
+        self.error_type_map = self._setup_error_type_map()
+        self.error_classifiers = self._setup_error_classifiers()
     
     def _setup_recovery_strategies(self) -> Dict[ErrorType, Callable]:
         """Setup error recovery strategies for different error types"""
@@ -36,6 +70,32 @@ class ConversationErrorHandler:
             ErrorType.VALIDATION: self._handle_validation_error
         }
     
+    def _setup_error_type_map(self) -> Dict[type, ErrorType]:
+        """Setup direct exception type to error type mapping"""
+        return {
+            SQLAlchemyError: ErrorType.DATABASE,
+            TimeoutException: ErrorType.EXTERNAL_SERVICE,
+            ConnectError: ErrorType.EXTERNAL_SERVICE,
+            HTTPStatusError: ErrorType.EXTERNAL_SERVICE,
+            ValidationError: ErrorType.VALIDATION
+        }
+    
+    def _setup_error_classifiers(self) -> List[Tuple[re.Pattern, ErrorType]]:
+        """
+        Setup precompiled keyword patterns for error classification
+        Order matters: the first matching pattern wins
+        """
+        keywords = [
+            (["database", "connection", "sqlalchemy", "psycopg"], ErrorType.DATABASE),
+            (["timeout", "connection", "http", "api", "service"], ErrorType.EXTERNAL_SERVICE),
+            (["validation", "invalid", "format", "required"], ErrorType.VALIDATION),
+            (["parse", "extract", "process", "decode"], ErrorType.INPUT_PROCESSING),
+        ]
+        return [
+            (re.compile("|".join(words), re.IGNORECASE), error_type)
+            for words, error_type in keywords
+        ]
+    
     async def handle_conversation_error(self, error: Exception, user_id: str, message: Message) -> Response:
         """
         Enhanced main error handler for conversation processing
@@ -141,24 +201,17 @@ class ConversationErrorHandler:
     
     def _classify_error(self, error: Exception) -> ErrorType:
         """Classify error into appropriate error type"""
-        error_str = str(error).lower()
-        error_type_name = type(error).__name__.lower()
-        
-        # Database-related errors
-        if any(keyword in error_str for keyword in ["database", "connection", "sqlalchemy", "psycopg"]):
-            return ErrorType.DATABASE
+        # Known exception types resolve through the MRO without inspecting the message
+        for cls in type(error).__mro__:
+            error_type = self.error_type_map.get(cls)
+            if error_type is not None:
+                return error_type
         
-        # External service errors
-        if any(keyword in error_str for keyword in ["timeout", "connection", "http", "api", "service"]):
-            return ErrorType.EXTERNAL_SERVICE
+        error_str = str(error)
         
-        # Validation errors
-        if any(keyword in error_str for keyword in ["validation", "invalid", "format", "required"]):
-            return ErrorType.VALIDATION
-        
-        # Input processing errors
-        if any(keyword in error_str for keyword in ["parse", "extract", "process", "decode"]):
-            return ErrorType.INPUT_PROCESSING
+        for pattern, error_type in self.error_classifiers:
+            if pattern.search(error_str):
+                return error_type
         
         # Default to business logic error
         return ErrorType.BUSINESS_LOGIC
@@ -278,31 +331,5 @@ class ConversationErrorHandler:
     
     def get_error_recovery_suggestions(self, error_type: ErrorType) -> Dict[str, Any]:
         """Get recovery suggestions for different error types"""
-        suggestions = {
-            ErrorType.INPUT_PROCESSING: {
-                "retry": True,
-                "alternative_input": True,
-                "manual_entry": True
-            },
-            ErrorType.EXTERNAL_SERVICE: {
-                "retry": True,
-                "wait_time": "1-2 minutes",
-                "fallback_mode": True
-            },
-            ErrorType.BUSINESS_LOGIC: {
-                "check_input": True,
-                "help_available": True,
-                "reset_option": True
-            },
-            ErrorType.DATABASE: {
-                "retry": True,
-                "temporary": True,
-                "wait_time": "30 seconds"
-            },
-            ErrorType.VALIDATION: {
-                "check_format": True,
-                "examples_available": True,
-                "help_available": True
-            }
-        }
-        return suggestions.get(error_type, {"retry": True, "reset_option": True})
\ No newline at end of file
+        suggestions = self.RECOVERY_SUGGESTIONS.get(error_type, {"retry": True, "reset_option": True})
+        return dict(suggestions)
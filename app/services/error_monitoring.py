@@ -4,8 +4,10 @@ Implements requirements 7.4, 7.5 for error logging and monitoring
 """
 import logging
 import json
+import os
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+import uuid
+from typing import Dict, Any, List, Optional, Callable, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
@@ -13,6 +15,7 @@ from enum import Enum
 
 from app.models.enums import ErrorType
 from app.core.config import settings
+from app.utils.logging import get_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -116,13 +119,26 @@ class ErrorMonitor:
         }
         self.alert_callbacks: List[Callable] = []
         self.error_patterns: Dict[str, int] = defaultdict(int)
+        self.max_queue_size = 10000
+        self.batch_size = 128
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._in_flight_events = 0
     
-    async def log_error(self, error: Exception, context: Dict[str, Any]) -> str:
+    async def log_error(self, error: Exception, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Log error with comprehensive context and monitoring
         Returns error event ID for tracking
+        
+        The bound request context is used as the base and extended with the
+        explicitly passed context, which takes precedence on conflicts
+        
+        Metrics are updated immediately; structured logging, pattern detection
+        and alerting are handed off to a background consumer in batches
         """
         try:
+            context = {**get_request_context(), **(context or {})}
+            
             # Generate unique error ID
             error_id = self._generate_error_id()
             
@@ -147,12 +163,8 @@ class ErrorMonitor:
             # Add to metrics
             self.metrics.add_error(error_event)
             
-            # Log structured error
-            await self._log_structured_error(error_event)
-            
-            # Check for patterns and alerts
-            await self._check_error_patterns(error_event)
-            await self._check_alert_thresholds(error_event)
+            # Defer logging, pattern and alert checks to the consumer task
+            await self._enqueue_event(error_event)
             
             return error_id
             
@@ -160,6 +172,34 @@ class ErrorMonitor:
             logger.critical(f"Error monitoring system failed: {e}")
             return "monitoring_failed"
     
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued error events have been processed, bounded by an optional timeout"""
+        if self._event_queue is None or not self._drain_task or self._drain_task.done():
+            return True
+        
+        try:
+            await asyncio.wait_for(self._event_queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            dropped = self._event_queue.qsize() + self._in_flight_events
+            logger.warning(
+                f"Timed out after {timeout}s flushing error events; "
+                f"dropping {dropped} unprocessed events"
+            )
+            return False
+    
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush pending error events within the timeout and stop the background consumer"""
+        await self.flush(timeout=timeout)
+        if self._drain_task and not self._drain_task.done():
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+        self._drain_task = None
+        self._event_queue = None
+    
     async def resolve_error(self, error_id: str, resolution_notes: str = "") -> bool:
         """Mark error as resolved"""
         try:
@@ -258,6 +298,46 @@ class ErrorMonitor:
         # Default to low severity
         return ErrorSeverity.LOW
     
+    async def _enqueue_event(self, error_event: ErrorEvent) -> None:
+        """Queue error event for background processing, falling back to inline processing"""
+        self._ensure_drain_task()
+        try:
+            self._event_queue.put_nowait(error_event)
+        except asyncio.QueueFull:
+            logger.warning("Error event queue full, processing event inline")
+            await self._process_event(error_event)
+    
+    def _ensure_drain_task(self) -> None:
+        """Start the consumer task on the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if (self._drain_task is None or self._drain_task.done()
+                or self._drain_task.get_loop() is not loop):
+            self._event_queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._in_flight_events = 0
+            self._drain_task = loop.create_task(self._drain_events(self._event_queue))
+    
+    async def _drain_events(self, queue: asyncio.Queue) -> None:
+        """Consume queued error events in batches"""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            self._in_flight_events = len(batch)
+            for error_event in batch:
+                await self._process_event(error_event)
+                self._in_flight_events -= 1
+                queue.task_done()
+    
+    async def _process_event(self, error_event: ErrorEvent) -> None:
+        """Log error event and run pattern and alert checks"""
+        try:
+            await self._log_structured_error(error_event)
+            await self._check_error_patterns(error_event)
+            await self._check_alert_thresholds(error_event)
+        except Exception as e:
+            logger.error(f"Failed to process error event {error_event.id}: {e}")
+    
     async def _log_structured_error(self, error_event: ErrorEvent) -> None:
         """Log error in structured format for analysis"""
         try:
@@ -343,19 +423,25 @@ class ErrorMonitor:
             logger.error(f"Failed to check alert thresholds: {e}")
     
     async def _trigger_alerts(self, error_event: ErrorEvent) -> None:
-        """Trigger registered alert callbacks"""
+        """Trigger registered alert callbacks concurrently"""
         try:
-            for callback in self.alert_callbacks:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(error_event)
-                    else:
-                        callback(error_event)
-                except Exception as e:
-                    logger.error(f"Alert callback failed: {e}")
+            await asyncio.gather(*(
+                self._run_alert_callback(callback, error_event)
+                for callback in self.alert_callbacks
+            ))
         except Exception as e:
             logger.error(f"Failed to trigger alerts: {e}")
     
+    async def _run_alert_callback(self, callback: Callable, error_event: ErrorEvent) -> None:
+        """Run a single alert callback, isolating its failures from the others"""
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(error_event)
+            else:
+                callback(error_event)
+        except Exception as e:
+            logger.error(f"Alert callback failed: {e}")
+    
     def _count_unresolved_by_severity(self, severity: ErrorSeverity) -> int:
         """Count unresolved errors by severity"""
         return sum(1 for event in self.metrics.error_events 
@@ -363,7 +449,6 @@ class ErrorMonitor:
     
     def _generate_error_id(self) -> str:
         """Generate unique error ID"""
-        import uuid
         return str(uuid.uuid4())[:12]
 
 
@@ -377,41 +462,38 @@ class HealthChecker:
     Implements requirement 7.5 for monitoring system
     """
     
-    def __init__(self):
+    def __init__(self, check_timeout: float = 2.0):
         self.health_checks: Dict[str, Callable] = {}
+        self.async_health_checks: Set[str] = set()
         self.last_check_results: Dict[str, Dict[str, Any]] = {}
+        self.check_timeout = check_timeout
     
     def register_health_check(self, name: str, check_func: Callable) -> None:
         """Register a health check function"""
         self.health_checks[name] = check_func
+        # Resolve sync/async once at registration instead of on every run
+        if asyncio.iscoroutinefunction(check_func):
+            self.async_health_checks.add(name)
+        else:
+            self.async_health_checks.discard(name)
     
     async def run_health_checks(self) -> Dict[str, Any]:
-        """Run all registered health checks"""
+        """Run all registered health checks concurrently"""
         results = {
             "timestamp": datetime.now().isoformat(),
             "overall_status": "healthy",
             "checks": {}
         }
         
-        for name, check_func in self.health_checks.items():
-            try:
-                if asyncio.iscoroutinefunction(check_func):
-                    check_result = await check_func()
-                else:
-                    check_result = check_func()
-                
-                results["checks"][name] = {
-                    "status": "healthy",
-                    "details": check_result,
-                    "last_checked": datetime.now().isoformat()
-                }
-                
-            except Exception as e:
-                results["checks"][name] = {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "last_checked": datetime.now().isoformat()
-                }
+        # Overall latency is bounded by the slowest check, not the sum of all checks
+        check_results = await asyncio.gather(*(
+            self._run_health_check(name, check_func)
+            for name, check_func in self.health_checks.items()
+        ))
+        
+        for name, check_result in zip(self.health_checks, check_results):
+            results["checks"][name] = check_result
+            if check_result["status"] != "healthy":
                 results["overall_status"] = "degraded"
         
         # Store results for comparison
@@ -419,6 +501,34 @@ class HealthChecker:
         
         return results
     
+    async def _run_health_check(self, name: str, check_func: Callable) -> Dict[str, Any]:
+        """Run a single health check, bounding async checks by the check timeout"""
+        try:
+            if name in self.async_health_checks:
+                check_result = await asyncio.wait_for(check_func(), timeout=self.check_timeout)
+            else:
+                check_result = check_func()
+            
+            return {
+                "status": "healthy",
+                "details": check_result,
+                "last_checked": datetime.now().isoformat()
+            }
+            
+        except asyncio.TimeoutError:
+            logger.warning(f"Health check {name} timed out after {self.check_timeout}s")
+            return {
+                "status": "unhealthy",
+                "error": f"Health check timed out after {self.check_timeout}s",
+                "last_checked": datetime.now().isoformat()
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+                "last_checked": datetime.now().isoformat()
+            }
+    
     async def get_system_metrics(self) -> Dict[str, Any]:
         """Get comprehensive system metrics"""
         return {
@@ -433,7 +543,6 @@ class HealthChecker:
         """Get application uptime information"""
         try:
             import psutil
-            import os
             
             process = psutil.Process(os.getpid())
             create_time = datetime.fromtimestamp(process.create_time())
@@ -453,7 +562,6 @@ class HealthChecker:
         """Get memory usage information"""
         try:
             import psutil
-            import os
             
             process = psutil.Process(os.getpid())
             memory_info = process.memory_info()
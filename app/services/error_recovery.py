@@ -4,7 +4,8 @@ Implements requirements 7.1, 7.3 for graceful degradation and external service f
 """
 import asyncio
 import logging
-from typing import Dict, Any, Optional, Callable, List
+import time
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
@@ -43,6 +44,26 @@ class ErrorRecoveryService:
     Provides automatic recovery mechanisms for various failure scenarios
     """
     
+    DEGRADATION_SUGGESTIONS: Dict[str, Tuple[str, ...]] = {
+        "sarvam_ai": (
+            "Try typing your message instead of voice",
+            "Speak more clearly if using voice messages"
+        ),
+        "gemini_vision": (
+            "Take a clearer photo of your bill",
+            "Type the bill information manually",
+            "Ensure good lighting when taking photos"
+        ),
+        "litellm": (
+            "Use simple, clear language",
+            "Break down complex requests into smaller parts"
+        ),
+        "siren": (
+            "Messages may be delayed",
+            "Try again in a few minutes"
+        )
+    }
+    
     def __init__(self):
         self.recovery_strategies = self._setup_recovery_strategies()
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
@@ -315,27 +336,7 @@ class ErrorRecoveryService:
     
     def _get_degradation_suggestions(self, service_name: str) -> List[str]:
         """Get suggestions for users when service is degraded"""
-        suggestions = {
-            "sarvam_ai": [
-                "Try typing your message instead of voice",
-                "Speak more clearly if using voice messages"
-            ],
-            "gemini_vision": [
-                "Take a clearer photo of your bill",
-                "Type the bill information manually",
-                "Ensure good lighting when taking photos"
-            ],
-            "litellm": [
-                "Use simple, clear language",
-                "Break down complex requests into smaller parts"
-            ],
-            "siren": [
-                "Messages may be delayed",
-                "Try again in a few minutes"
-            ]
-        }
-        
-        return suggestions.get(service_name, ["Please try again later"])
+        return list(self.DEGRADATION_SUGGESTIONS.get(service_name, ("Please try again later",)))
     
     def _classify_error(self, error: Exception) -> ErrorType:
         """Classify error into application error type"""
@@ -403,6 +404,7 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.failure_count = 0
         self.last_failure_time: Optional[datetime] = None
+        self._last_failure_monotonic: Optional[float] = None
         self.state = "closed"  # closed, open, half-open
     
     async def call(self, operation: Callable) -> Any:
@@ -423,10 +425,11 @@ class CircuitBreaker:
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt reset"""
-        if not self.last_failure_time:
+        if self._last_failure_monotonic is None:
             return True
         
-        return (datetime.now() - self.last_failure_time).total_seconds() > self.recovery_timeout
+        # Monotonic clock keeps the timeout immune to wall-clock adjustments
+        return time.monotonic() - self._last_failure_monotonic > self.recovery_timeout
     
     def _on_success(self) -> None:
         """Handle successful operation"""
@@ -437,6 +440,7 @@ class CircuitBreaker:
         """Handle failed operation"""
         self.failure_count += 1
         self.last_failure_time = datetime.now()
+        self._last_failure_monotonic = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.state = "open"
@@ -12,7 +12,7 @@ Requirements implemented:
 """
 import asyncio
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, ClassVar
 from datetime import datetime, timedelta
 from decimal import Decimal
 from dataclasses import dataclass
@@ -59,22 +59,35 @@ class PaymentConfirmationService:
     Implements requirements 5.1, 5.2, 5.3, 5.5
     """
     
+    # Confirmation patterns for message parsing
+    CONFIRMATION_PATTERNS: ClassVar[Tuple[str, ...]] = (
+        r'\b(done|paid|complete|completed|finished|confirmed|sent)\b',
+        r'\b(payment\s+(done|made|sent|completed))\b',
+        r'\b(money\s+(sent|transferred|paid))\b',
+        r'\b(amount\s+(paid|sent|transferred))\b',
+        r'✅',  # Checkmark emoji
+        r'👍',  # Thumbs up emoji
+    )
+    
+    # Payment status inquiry patterns
+    INQUIRY_PATTERNS: ClassVar[Tuple[str, ...]] = (
+        r'\b(status|check|how much|amount|bill|payment)\b',
+        r'\b(what.*owe|how.*much.*pay)\b',
+        r'\b(bill.*details|payment.*info)\b',
+    )
+    
+    # Compiled once per process as single alternations; the service is
+    # instantiated per inbound message
+    CONFIRMATION_RE: ClassVar[re.Pattern] = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in CONFIRMATION_PATTERNS), re.IGNORECASE
+    )
+    INQUIRY_RE: ClassVar[re.Pattern] = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in INQUIRY_PATTERNS), re.IGNORECASE
+    )
+    
     def __init__(self, db_repository: DatabaseRepository):
         self.db = db_repository
         self.communication = communication_service
-        
-        # Confirmation patterns for message parsing
-        self.confirmation_patterns = [
-            r'\b(done|paid|complete|completed|finished|confirmed|sent)\b',
-            r'\b(payment\s+(done|made|sent|completed))\b',
-            r'\b(money\s+(sent|transferred|paid))\b',
-            r'\b(amount\s+(paid|sent|transferred))\b',
-            r'✅',  # Checkmark emoji
-            r'👍',  # Thumbs up emoji
-        ]
-        
-        # Compile patterns for efficiency
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.confirmation_patterns]
     
     async def process_payment_confirmation_message(
         self,
@@ -359,12 +372,7 @@ class PaymentConfirmationService:
         if not message_content:
             return False
         
-        # Check against compiled patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(message_content):
-                return True
-        
-        return False
+        return self.CONFIRMATION_RE.search(message_content) is not None
     
     async def _find_active_participants_by_phone(self, phone_number: str) -> List[BillParticipant]:
         """
@@ -450,18 +458,7 @@ The bill is now complete. Thanks for using Bill Splitter! 🙏"""
         """
         try:
             # Check if message is asking about payment status
-            inquiry_patterns = [
-                r'\b(status|check|how much|amount|bill|payment)\b',
-                r'\b(what.*owe|how.*much.*pay)\b',
-                r'\b(bill.*details|payment.*info)\b'
-            ]
-            
-            is_inquiry = any(
-                re.search(pattern, message_content, re.IGNORECASE) 
-                for pattern in inquiry_patterns
-            )
-            
-            if not is_inquiry:
+            if not self.INQUIRY_RE.search(message_content):
                 return None
             
             # Find participant's active bills
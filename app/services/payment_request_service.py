@@ -13,6 +13,7 @@ Requirements implemented:
 - 4.5: Store tracking information in the database
 """
 import asyncio
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -20,7 +21,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from app.clients.siren_client import siren_client, SirenError
-from app.services.communication_service import communication_service
+from app.services.communication_service import CommunicationService, communication_service
 from app.services.upi_service import UPIService, UPIApp
 from app.models.database import Bill, BillParticipant, PaymentRequest, Contact, User
 from app.models.enums import DeliveryMethod
@@ -56,6 +57,17 @@ class PaymentRequestResult:
     payment_request_id: Optional[str] = None
 
 
+@dataclass
+class PendingPaymentRequest:
+    """Payment request that has been recorded but not yet sent"""
+    participant: BillParticipant
+    participant_name: str
+    phone_number: str
+    upi_link: str
+    message: str
+    payment_request: PaymentRequest
+
+
 @dataclass
 class DistributionSummary:
     """Summary of payment request distribution"""
@@ -76,10 +88,18 @@ class PaymentRequestService:
     Implements requirements 4.1, 4.2, 4.3, 4.4, 4.5
     """
     
-    def __init__(self, db_repository: DatabaseRepository, upi_service: UPIService):
+    # Upper bound on concurrent in-flight message sends (not a messages-per-second limit)
+    MAX_CONCURRENT_SENDS = 50
+    
+    def __init__(
+        self,
+        db_repository: DatabaseRepository,
+        upi_service: UPIService,
+        communication: Optional[CommunicationService] = None
+    ):
         self.db = db_repository
         self.upi_service = upi_service
-        self.communication = communication_service
+        self.communication = communication or communication_service
         
         # Message templates
         self.templates = {
@@ -119,34 +139,54 @@ class PaymentRequestService:
             if not bill.participants:
                 raise ValueError(f"No participants found for bill {bill_id}")
             
-            # Generate payment requests for each participant
-            results = []
+            # Database work shares one session, so preparation and status updates stay
+            # serial in participant order; only the message sends run concurrently
+            prepared = []
             for participant in bill.participants:
                 if participant.payment_status == 'confirmed':
                     logger.info(f"Skipping participant {participant.id} - already paid")
                     continue
                 
-                result = await self._send_payment_request_to_participant(
-                    bill=bill,
-                    participant=participant,
-                    custom_message=custom_message
-                )
-                results.append(result)
+                try:
+                    prepared.append(await self._prepare_payment_request(
+                        bill=bill,
+                        participant=participant,
+                        custom_message=custom_message
+                    ))
+                except Exception as e:
+                    prepared.append(self._failed_payment_request_result(participant, e))
+            
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+            
+            async def send_with_limit(item) -> Optional[Dict[str, Any]]:
+                if isinstance(item, PaymentRequestResult):
+                    return None  # Already failed during preparation
+                async with semaphore:
+                    return await self.communication.send_message_with_fallback(
+                        phone_number=item.phone_number,
+                        message=item.message
+                    )
             
-            # Create distribution summary
-            completed_at = datetime.now()
-            summary = DistributionSummary(
-                bill_id=bill_id,
-                total_participants=len(results),
-                successful_sends=len([r for r in results if r.success]),
-                failed_sends=len([r for r in results if not r.success]),
-                whatsapp_sends=len([r for r in results if r.delivery_method == DeliveryMethod.WHATSAPP]),
-                sms_sends=len([r for r in results if r.delivery_method == DeliveryMethod.SMS]),
-                results=results,
-                started_at=started_at,
-                completed_at=completed_at
+            delivery_results = await asyncio.gather(
+                *(send_with_limit(item) for item in prepared),
+                return_exceptions=True
             )
             
+            results = []
+            for item, delivery_result in zip(prepared, delivery_results):
+                if isinstance(item, PaymentRequestResult):
+                    results.append(item)
+                elif isinstance(delivery_result, Exception):
+                    results.append(self._failed_payment_request_result(item.participant, delivery_result))
+                else:
+                    try:
+                        results.append(await self._complete_payment_request(item, delivery_result))
+                    except Exception as e:
+                        results.append(self._failed_payment_request_result(item.participant, e))
+            
+            # Create distribution summary
+            summary = self._build_distribution_summary(bill_id, results, started_at)
+            
             # Send confirmation to organizer
             await self._send_organizer_confirmation(
                 organizer_phone=organizer_phone,
@@ -163,96 +203,138 @@ class PaymentRequestService:
             logger.error(f"Payment request distribution failed for bill {bill_id}: {e}")
             raise
     
-    async def _send_payment_request_to_participant(
+    def _build_distribution_summary(
+        self,
+        bill_id: str,
+        results: List[PaymentRequestResult],
+        started_at: datetime
+    ) -> DistributionSummary:
+        """Build distribution summary, tallying all outcome counts in a single pass"""
+        counts = Counter()
+        for result in results:
+            counts["successful" if result.success else "failed"] += 1
+            counts[result.delivery_method] += 1
+        
+        return DistributionSummary(
+            bill_id=bill_id,
+            total_participants=len(results),
+            successful_sends=counts["successful"],
+            failed_sends=counts["failed"],
+            whatsapp_sends=counts[DeliveryMethod.WHATSAPP],
+            sms_sends=counts[DeliveryMethod.SMS],
+            results=results,
+            started_at=started_at,
+            completed_at=datetime.now()
+        )
+    
+    async def _prepare_payment_request(
         self,
         bill: Bill,
         participant: BillParticipant,
         custom_message: Optional[str] = None
+    ) -> PendingPaymentRequest:
+        """
+        Build the UPI link and message for a participant and record the payment request
+        Implements requirements 4.1, 4.5
+        """
+        # Get contact information
+        contact = participant.contact
+        if not contact:
+            raise ValueError(f"Contact not found for participant {participant.id}")
+        
+        participant_name = contact.name or "Friend"
+        phone_number = contact.phone_number
+        
+        if not phone_number:
+            raise ValueError(f"Phone number not found for participant {participant.id}")
+        
+        # Generate UPI link (Requirement 4.1)
+        upi_link = self.upi_service.generate_upi_link(
+            recipient_name=participant_name,
+            amount=participant.amount_owed,
+            description=f"Bill Split: {bill.description or 'Shared Expense'}",
+            upi_app=UPIApp.GENERIC
+        )
+        
+        # Create personalized message
+        message = self._create_payment_message(
+            participant_name=participant_name,
+            amount=participant.amount_owed,
+            bill_description=bill.description or "Shared Expense",
+            upi_link=upi_link,
+            custom_message=custom_message
+        )
+        
+        # Create payment request record in database (Requirement 4.5)
+        payment_request = await self._create_payment_request_record(
+            participant=participant,
+            upi_link=upi_link
+        )
+        
+        return PendingPaymentRequest(
+            participant=participant,
+            participant_name=participant_name,
+            phone_number=phone_number,
+            upi_link=upi_link,
+            message=message,
+            payment_request=payment_request
+        )
+    
+    async def _complete_payment_request(
+        self,
+        pending: PendingPaymentRequest,
+        delivery_result: Dict[str, Any]
     ) -> PaymentRequestResult:
         """
-        Send payment request to a single participant
-        Implements requirements 4.1, 4.2, 4.3, 4.5
+        Record the delivery outcome of a sent payment request
+        Implements requirements 4.2, 4.3, 4.5
         """
-        try:
-            # Get contact information
-            contact = participant.contact
-            if not contact:
-                raise ValueError(f"Contact not found for participant {participant.id}")
-            
-            participant_name = contact.name or "Friend"
-            phone_number = contact.phone_number
-            
-            if not phone_number:
-                raise ValueError(f"Phone number not found for participant {participant.id}")
-            
-            # Generate UPI link (Requirement 4.1)
-            upi_link = self.upi_service.generate_upi_link(
-                recipient_name=participant_name,
-                amount=participant.amount_owed,
-                description=f"Bill Split: {bill.description or 'Shared Expense'}",
-                upi_app=UPIApp.GENERIC
-            )
-            
-            # Create personalized message
-            message = self._create_payment_message(
-                participant_name=participant_name,
-                amount=participant.amount_owed,
-                bill_description=bill.description or "Shared Expense",
-                upi_link=upi_link,
-                custom_message=custom_message
-            )
-            
-            # Create payment request record in database (Requirement 4.5)
-            payment_request = await self._create_payment_request_record(
-                participant=participant,
-                upi_link=upi_link
-            )
-            
-            # Send message with fallback (Requirements 4.2, 4.3)
-            delivery_result = await self.communication.send_message_with_fallback(
-                phone_number=phone_number,
-                message=message
-            )
-            
-            # Update payment request record with delivery status
-            await self._update_payment_request_status(
-                payment_request_id=payment_request.id,
-                delivery_result=delivery_result
-            )
-            
-            # Update participant status
-            if delivery_result["success"]:
-                participant.payment_status = 'sent'
-                await self.db.update_bill_participant(participant)
-            
-            return PaymentRequestResult(
-                participant_id=str(participant.id),
-                participant_name=participant_name,
-                phone_number=phone_number,
-                amount=participant.amount_owed,
-                success=delivery_result["success"],
-                delivery_method=delivery_result.get("final_method"),
-                fallback_used=delivery_result.get("fallback_used", False),
-                upi_link=upi_link,
-                message_sent=message,
-                error=delivery_result.get("error"),
-                payment_request_id=str(payment_request.id)
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to send payment request to participant {participant.id}: {e}")
-            return PaymentRequestResult(
-                participant_id=str(participant.id),
-                participant_name=getattr(participant.contact, 'name', 'Unknown') if participant.contact else 'Unknown',
-                phone_number=getattr(participant.contact, 'phone_number', 'Unknown') if participant.contact else 'Unknown',
-                amount=participant.amount_owed,
-                success=False,
-                delivery_method=None,
-                fallback_used=False,
-                upi_link="",
-                message_sent="",
-                error=str(e)
-            )
+        participant = pending.participant
+        
+        # Update payment request record with delivery status
+        await self._update_payment_request_status(
+            payment_request_id=pending.payment_request.id,
+            delivery_result=delivery_result
+        )
+        
+        # Update participant status
+        if delivery_result["success"]:
+            participant.payment_status = 'sent'
+            await self.db.update_bill_participant(participant)
+        
+        return PaymentRequestResult(
+            participant_id=str(participant.id),
+            participant_name=pending.participant_name,
+            phone_number=pending.phone_number,
+            amount=participant.amount_owed,
+            success=delivery_result["success"],
+            delivery_method=delivery_result.get("final_method"),
+            fallback_used=delivery_result.get("fallback_used", False),
+            upi_link=pending.upi_link,
+            message_sent=pending.message,
+            error=delivery_result.get("error"),
+            payment_request_id=str(pending.payment_request.id)
+        )
+    
+    def _failed_payment_request_result(
+        self,
+        participant: BillParticipant,
+        error: Exception
+    ) -> PaymentRequestResult:
+        """Build the result for a participant whose payment request could not be sent"""
+        logger.error(f"Failed to send payment request to participant {participant.id}: {error}")
+        return PaymentRequestResult(
+            participant_id=str(participant.id),
+            participant_name=getattr(participant.contact, 'name', 'Unknown') if participant.contact else 'Unknown',
+            phone_number=getattr(participant.contact, 'phone_number', 'Unknown') if participant.contact else 'Unknown',
+            amount=participant.amount_owed,
+            success=False,
+            delivery_method=None,
+            fallback_used=False,
+            upi_link="",
+            message_sent="",
+            error=str(error)
+        )
     
     async def _create_payment_request_record(
         self,
@@ -469,18 +551,7 @@ class PaymentRequestService:
                 await self.db.update_bill_participant(participant)
             
             # Create summary
-            completed_at = datetime.now()
-            summary = DistributionSummary(
-                bill_id=bill_id,
-                total_participants=len(results),
-                successful_sends=len([r for r in results if r.success]),
-                failed_sends=len([r for r in results if not r.success]),
-                whatsapp_sends=len([r for r in results if r.delivery_method == DeliveryMethod.WHATSAPP]),
-                sms_sends=len([r for r in results if r.delivery_method == DeliveryMethod.SMS]),
-                results=results,
-                started_at=started_at,
-                completed_at=completed_at
-            )
+            summary = self._build_distribution_summary(bill_id, results, started_at)
             
             logger.info(f"Payment reminders sent for bill {bill_id}: "
                        f"{summary.successful_sends}/{summary.total_participants} successful")
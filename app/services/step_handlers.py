@@ -4,6 +4,8 @@ Each handler manages a specific step in the bill splitting process
 """
 
 import logging
+import re
+from decimal import Decimal
 from typing import Dict, Any, Optional, List
 from app.models.enums import ConversationStep, MessageType
 from app.models.schemas import (
@@ -321,8 +323,6 @@ class BillExtractionHandler(BaseStepHandler):
                 partial_data = BillData(**state.context["partial_bill_data"])
             else:
                 # Create minimal bill data for question generation
-                from decimal import Decimal
-
                 partial_data = BillData(
                     total_amount=Decimal("0.00"),
                     description="",
@@ -678,8 +678,6 @@ class ContactCollectionHandler(BaseStepHandler):
         responses = {}
 
         # Simple parsing - look for phone numbers in the message
-        import re
-
         phone_pattern = r"[\+]?[1-9][\d\s\-\(\)]{8,15}"
         phones = re.findall(phone_pattern, message_content)
 
@@ -1120,8 +1118,6 @@ class SplitConfirmationHandler(BaseStepHandler):
         content = message.content
 
         # Look for currency symbols or amount patterns
-        import re
-
         amount_pattern = r"[₹$]\s*\d+|\d+\s*[₹$]|\d+\.\d{2}"
 
         return bool(re.search(amount_pattern, content))
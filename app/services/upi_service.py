@@ -18,6 +18,44 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# UPI query parameters consumed by the service, mapped to payment info fields
+UPI_PARAM_FIELDS = {
+    'pa': 'payee_address',
+    'am': 'amount',
+    'tn': 'transaction_note',
+    'pn': 'payee_name',
+    'cu': 'currency',
+}
+
+# Text that urllib.parse.quote would return unchanged (always-safe characters plus '/')
+_QUOTE_SAFE_RE = re.compile(r'[A-Za-z0-9_.~/-]*')
+
+
+def _fast_quote(text: str) -> str:
+    """Percent-encode text like urllib.parse.quote, skipping the encode for already safe text"""
+    if _QUOTE_SAFE_RE.fullmatch(text):
+        return text
+    return quote(text)
+
+
+def _parse_upi_params(upi_link: str) -> Dict[str, str]:
+    """Scan the query string of a scheme://pay?k=v&k=v link for known UPI parameters"""
+    params = {}
+    query_start = upi_link.find('?')
+    if query_start < 0:
+        return params
+    
+    for token in upi_link[query_start + 1:].split('&'):
+        separator = token.find('=')
+        if separator <= 0:
+            continue
+        key = token[:separator]
+        # First occurrence wins, matching a left-to-right search of the link
+        if key in UPI_PARAM_FIELDS and key not in params:
+            params[key] = token[separator + 1:]
+    
+    return params
+
 
 class UPIApp(Enum):
     """Supported UPI applications"""
@@ -72,9 +110,34 @@ class UPIService:
         )
     }
     
+    # Link prefixes accepted by validation
+    VALID_SCHEMES = ('upi://', 'gpay://', 'phonepe://', 'paytmmp://', 'bhim://')
+    
+    # User-facing names for each UPI app
+    APP_DISPLAY_NAMES = {
+        UPIApp.GPAY: "Google Pay",
+        UPIApp.PHONEPE: "PhonePe",
+        UPIApp.PAYTM: "Paytm",
+        UPIApp.BHIM: "BHIM",
+        UPIApp.GENERIC: "Any UPI App"
+    }
+    
     # Default UPI ID for the system (should be configured via environment)
     DEFAULT_UPI_ID = "billsplitter@upi"
     
+    # Fixed UPI query parameters, pre-encoded
+    PAYEE_NAME_PARAM = f"pn={quote('Bill Splitter')}"
+    CURRENCY_PARAM = f"cu={quote('INR')}"
+    
+    # Largest amount accepted for a single payment request (₹1,00,000)
+    MAX_AMOUNT = Decimal('100000')
+    
+    # UPI ID format: username@bank (e.g., user@paytm, 9876543210@ybl)
+    UPI_ID_RE = re.compile(r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+$')
+    
+    # Characters stripped from free-text link parameters
+    UNSAFE_TEXT_RE = re.compile(r'[^\w\s-]')
+    
     def __init__(self, default_upi_id: Optional[str] = None):
         """Initialize UPI service with optional custom UPI ID"""
         self.default_upi_id = default_upi_id or self.DEFAULT_UPI_ID
@@ -90,9 +153,20 @@ class UPIService:
         Returns:
             bool: True if valid, False otherwise
         """
-        # UPI ID format: username@bank (e.g., user@paytm, 9876543210@ybl)
-        upi_pattern = r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+$'
-        return bool(re.match(upi_pattern, upi_id))
+        return self.UPI_ID_RE.match(upi_id) is not None
+    
+    def validate_upi_ids_batch(self, upi_ids: List[str]) -> List[bool]:
+        """
+        Validate a batch of UPI IDs, e.g. when importing contacts
+        
+        Args:
+            upi_ids: UPI IDs to validate
+            
+        Returns:
+            List[bool]: Validity of each UPI ID, in input order
+        """
+        match = self.UPI_ID_RE.match
+        return [match(upi_id) is not None for upi_id in upi_ids]
     
     def validate_amount(self, amount: Decimal) -> bool:
         """
@@ -104,7 +178,20 @@ class UPIService:
         Returns:
             bool: True if valid, False otherwise
         """
-        return amount > 0 and amount <= Decimal('100000')  # Max ₹1,00,000
+        return 0 < amount <= self.MAX_AMOUNT
+    
+    def validate_amounts_batch(self, amounts: List[Decimal]) -> List[bool]:
+        """
+        Validate a batch of payment amounts, e.g. all shares of a bill
+        
+        Args:
+            amounts: Amounts to validate
+            
+        Returns:
+            List[bool]: Validity of each amount, in input order
+        """
+        max_amount = self.MAX_AMOUNT
+        return [0 < amount <= max_amount for amount in amounts]
     
     def sanitize_text(self, text: str) -> str:
         """
@@ -117,7 +204,7 @@ class UPIService:
             str: Sanitized text
         """
         # Remove special characters and limit length
-        sanitized = re.sub(r'[^\w\s-]', '', text)
+        sanitized = self.UNSAFE_TEXT_RE.sub('', text)
         return sanitized[:50].strip()
     
     def generate_upi_link(
@@ -145,37 +232,16 @@ class UPIService:
             UPIValidationError: If validation fails
         """
         try:
-            # Validate inputs
-            if not self.validate_amount(amount):
-                raise UPIValidationError(f"Invalid amount: {amount}")
-            
-            payee_id = payee_upi_id or self.default_upi_id
-            if not self.validate_upi_id(payee_id):
-                raise UPIValidationError(f"Invalid UPI ID: {payee_id}")
-            
-            # Sanitize inputs
-            clean_name = self.sanitize_text(recipient_name)
-            clean_description = self.sanitize_text(description)
+            query_params = self._build_query_params(
+                recipient_name=recipient_name,
+                amount=amount,
+                description=description,
+                payee_upi_id=payee_upi_id
+            )
             
             # Get UPI configuration
             config = self.UPI_CONFIGS.get(upi_app, self.UPI_CONFIGS[UPIApp.GENERIC])
             
-            # Build UPI parameters
-            params = {
-                'pa': payee_id,  # Payee address (UPI ID)
-                'pn': 'Bill Splitter',  # Payee name
-                'am': str(amount),  # Amount
-                'cu': 'INR',  # Currency
-                'tn': clean_description  # Transaction note
-            }
-            
-            # Add recipient name to transaction note if provided
-            if clean_name:
-                params['tn'] = f"{clean_description} - {clean_name}"
-            
-            # Build query string
-            query_params = '&'.join([f"{k}={quote(str(v))}" for k, v in params.items()])
-            
             # Generate the link
             upi_link = f"{config.scheme}?{query_params}"
             
@@ -186,6 +252,41 @@ class UPIService:
             logger.error(f"Failed to generate UPI link: {e}")
             raise UPIValidationError(f"UPI link generation failed: {str(e)}")
     
+    def _build_query_params(
+        self,
+        recipient_name: str,
+        amount: Decimal,
+        description: str,
+        payee_upi_id: Optional[str] = None
+    ) -> str:
+        """
+        Validate payment details and build the app-independent UPI query string
+        
+        Raises:
+            UPIValidationError: If validation fails
+        """
+        # Validate inputs
+        if not self.validate_amount(amount):
+            raise UPIValidationError(f"Invalid amount: {amount}")
+        
+        payee_id = payee_upi_id or self.default_upi_id
+        if not self.validate_upi_id(payee_id):
+            raise UPIValidationError(f"Invalid UPI ID: {payee_id}")
+        
+        # Sanitize inputs
+        clean_name = self.sanitize_text(recipient_name)
+        clean_description = self.sanitize_text(description)
+        
+        # Add recipient name to transaction note if provided
+        transaction_note = f"{clean_description} - {clean_name}" if clean_name else clean_description
+        
+        # Build query string: payee address, payee name, amount, currency, transaction note.
+        # Payee name and currency never change, so they are encoded once up front.
+        return (
+            f"pa={_fast_quote(payee_id)}&{self.PAYEE_NAME_PARAM}&am={_fast_quote(str(amount))}"
+            f"&{self.CURRENCY_PARAM}&tn={_fast_quote(transaction_note)}"
+        )
+    
     def generate_multiple_app_links(
         self,
         recipient_name: str,
@@ -210,21 +311,25 @@ class UPIService:
         if apps is None:
             apps = [UPIApp.GENERIC, UPIApp.GPAY, UPIApp.PHONEPE, UPIApp.PAYTM]
         
-        links = {}
-        for app in apps:
-            try:
-                link = self.generate_upi_link(
-                    recipient_name=recipient_name,
-                    amount=amount,
-                    description=description,
-                    upi_app=app,
-                    payee_upi_id=payee_upi_id
-                )
-                links[app] = link
-            except UPIValidationError as e:
-                logger.warning(f"Failed to generate {app.value} link: {e}")
-                continue
+        # Only the scheme differs between apps, so build the query string once
+        try:
+            query_params = self._build_query_params(
+                recipient_name=recipient_name,
+                amount=amount,
+                description=description,
+                payee_upi_id=payee_upi_id
+            )
+        except Exception as e:
+            logger.warning(f"Failed to generate UPI links: {e}")
+            return {}
         
+        generic_config = self.UPI_CONFIGS[UPIApp.GENERIC]
+        links = {
+            app: f"{self.UPI_CONFIGS.get(app, generic_config).scheme}?{query_params}"
+            for app in apps
+        }
+        
+        logger.info(f"Generated {len(links)} UPI links for {recipient_name}: amount={amount}")
         return links
     
     def validate_upi_link(self, upi_link: str) -> Tuple[bool, Optional[str]]:
@@ -238,46 +343,39 @@ class UPIService:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
         """
         try:
-            # Check if it's a valid UPI scheme
-            valid_schemes = [
-                'upi://', 'gpay://', 'phonepe://', 'paytmmp://', 'bhim://'
-            ]
-            
-            if not any(upi_link.startswith(scheme) for scheme in valid_schemes):
+            # Reject foreign schemes before touching the query string
+            if not upi_link.startswith(self.VALID_SCHEMES):
                 return False, "Invalid UPI scheme"
             
-            # Check for required parameters
-            if 'pa=' not in upi_link:
-                return False, "Missing payee address (pa) parameter"
-            
-            if 'am=' not in upi_link:
-                return False, "Missing amount (am) parameter"
-            
-            # Extract and validate amount
-            try:
-                amount_match = re.search(r'am=([^&]+)', upi_link)
-                if amount_match:
-                    amount = Decimal(amount_match.group(1))
-                    if not self.validate_amount(amount):
-                        return False, f"Invalid amount: {amount}"
-            except (ValueError, TypeError):
-                return False, "Invalid amount format"
-            
-            # Extract and validate UPI ID
-            try:
-                upi_id_match = re.search(r'pa=([^&]+)', upi_link)
-                if upi_id_match:
-                    upi_id = upi_id_match.group(1)
-                    if not self.validate_upi_id(upi_id):
-                        return False, f"Invalid UPI ID: {upi_id}"
-            except Exception:
-                return False, "Invalid UPI ID format"
-            
-            return True, None
-            
+            return self._validate_upi_params(_parse_upi_params(upi_link))
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
+    def _validate_upi_params(self, params: Dict[str, str]) -> Tuple[bool, Optional[str]]:
+        """Validate the parsed query parameters of a UPI link"""
+        # Check for required parameters
+        if 'pa' not in params:
+            return False, "Missing payee address (pa) parameter"
+        
+        if 'am' not in params:
+            return False, "Missing amount (am) parameter"
+        
+        # Extract and validate amount
+        try:
+            if params['am']:
+                amount = Decimal(params['am'])
+                if not self.validate_amount(amount):
+                    return False, f"Invalid amount: {amount}"
+        except (ValueError, TypeError):
+            return False, "Invalid amount format"
+        
+        # Extract and validate UPI ID
+        upi_id = params['pa']
+        if upi_id and not self.validate_upi_id(upi_id):
+            return False, f"Invalid UPI ID: {upi_id}"
+        
+        return True, None
+    
     def extract_payment_info(self, upi_link: str) -> Optional[Dict[str, str]]:
         """
         Extract payment information from UPI link
@@ -289,38 +387,21 @@ class UPIService:
             Optional[Dict[str, str]]: Extracted payment info or None if invalid
         """
         try:
-            is_valid, error = self.validate_upi_link(upi_link)
+            if not upi_link.startswith(self.VALID_SCHEMES):
+                logger.warning("Invalid UPI link: Invalid UPI scheme")
+                return None
+            
+            params = _parse_upi_params(upi_link)
+            is_valid, error = self._validate_upi_params(params)
             if not is_valid:
                 logger.warning(f"Invalid UPI link: {error}")
                 return None
             
-            # Extract parameters
             info = {}
-            
-            # Extract payee address
-            pa_match = re.search(r'pa=([^&]+)', upi_link)
-            if pa_match:
-                info['payee_address'] = pa_match.group(1)
-            
-            # Extract amount
-            am_match = re.search(r'am=([^&]+)', upi_link)
-            if am_match:
-                info['amount'] = am_match.group(1)
-            
-            # Extract transaction note
-            tn_match = re.search(r'tn=([^&]+)', upi_link)
-            if tn_match:
-                info['transaction_note'] = tn_match.group(1)
-            
-            # Extract payee name
-            pn_match = re.search(r'pn=([^&]+)', upi_link)
-            if pn_match:
-                info['payee_name'] = pn_match.group(1)
-            
-            # Extract currency
-            cu_match = re.search(r'cu=([^&]+)', upi_link)
-            if cu_match:
-                info['currency'] = cu_match.group(1)
+            for key, field in UPI_PARAM_FIELDS.items():
+                value = params.get(key)
+                if value:
+                    info[field] = value
             
             return info
             
@@ -382,11 +463,4 @@ Thanks! 🙏"""
         Returns:
             str: Display name
         """
-        display_names = {
-            UPIApp.GPAY: "Google Pay",
-            UPIApp.PHONEPE: "PhonePe",
-            UPIApp.PAYTM: "Paytm",
-            UPIApp.BHIM: "BHIM",
-            UPIApp.GENERIC: "Any UPI App"
-        }
-        return display_names.get(app, app.value.title())
\ No newline at end of file
+        return self.APP_DISPLAY_NAMES.get(app, app.value.title())
\ No newline at end of file
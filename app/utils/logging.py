@@ -5,11 +5,16 @@ Implements requirements 7.4, 7.5 for error logging and monitoring
 import logging
 import sys
 import json
+from contextvars import ContextVar, Token
 from typing import Dict, Any, Optional
 from datetime import datetime
 from app.core.config import settings
 
 
+# Per-request context (request_id, user_id, ...) bound once at the entrypoint
+REQUEST_CONTEXT: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_context", default=None)
+
+
 class StructuredFormatter(logging.Formatter):
     """
     Custom formatter for structured logging with JSON output
@@ -173,6 +178,29 @@ def get_contextual_logger(name: str, context: Dict[str, Any]) -> LoggerAdapter:
     return LoggerAdapter(base_logger, context)
 
 
+def bind_request_context(**values: Any) -> Token:
+    """
+    Merge values into the current request context
+    
+    Args:
+        **values: Context fields such as request_id, user_id or service
+    
+    Returns:
+        Token that can be passed to reset_request_context
+    """
+    return REQUEST_CONTEXT.set({**(REQUEST_CONTEXT.get() or {}), **values})
+
+
+def reset_request_context(token: Token) -> None:
+    """Restore the request context to its state before the matching bind"""
+    REQUEST_CONTEXT.reset(token)
+
+
+def get_request_context() -> Dict[str, Any]:
+    """Get the context bound for the current request (empty if none)"""
+    return REQUEST_CONTEXT.get() or {}
+
+
 def log_error_with_context(logger: logging.Logger, error: Exception, 
                           context: Dict[str, Any]) -> None:
     """
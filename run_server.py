@@ -8,8 +8,9 @@ import logging
 from pathlib import Path
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 def main():
     """Main entry point for the server"""
@@ -44,8 +45,8 @@ def main():
             **uvicorn_config
         )
         
-    except Exception as e:
-        print(f"Failed to start server: {e}")
+    except Exception:
+        logging.getLogger(__name__).exception("Failed to start server")
         sys.exit(1)
 
 